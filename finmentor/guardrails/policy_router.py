@@ -8,8 +8,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class PolicyAction(str, Enum):
@@ -88,38 +89,109 @@ _TIMING_PATTERNS = [
 ]
 
 
+def _compile_union(patterns: list[str]) -> re.Pattern[str]:
+    """
+    Fuse a pattern list into one alternation so each category is a single scan.
+    Same semantics as "any pattern matches": each pattern is wrapped in its own group.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Compiled once at import so route() never pays for compile/cache lookups
+_ILLEGAL_RE = _compile_union(_ILLEGAL_PATTERNS)
+_ADVICE_RE = _compile_union(_ADVICE_PATTERNS)
+_ALLOCATION_RE = _compile_union(_ALLOCATION_PATTERNS)
+_TIMING_RE = _compile_union(_TIMING_PATTERNS)
+
 _TICKER_LIKE = re.compile(r"\b[A-Z]{1,5}\b")  # used only as a safety check in rewrites
+_AMOUNT_RE = re.compile(r"\$?\d[\d,]*(\.\d+)?")
+_BUYSELL_RE = re.compile(r"\b(buy|sell)\b", re.IGNORECASE)
+
+
+def _sanitize_rewrite(rewrite: str) -> str:
+    """
+    Final safety scrub: ensure rewrites are not actionable.
+    - Remove ticker-like tokens (AAPL, TSLA) if any slip in.
+    - Remove dollar amounts.
+    """
+    out = rewrite
 
+    # Remove $ amounts
+    out = _AMOUNT_RE.sub("[amount]", out)
 
-def _matches_any(patterns: list[str], text: str) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in patterns)
+    # Remove ticker-like tokens (very conservative)
+    out = _TICKER_LIKE.sub("[asset]", out)
 
+    # Avoid buy/sell verbs in rewrites
+    out = _BUYSELL_RE.sub("trade", out)
+
+    return out.strip()
 
-def _safe_rewrite_for_advice(original: str) -> str:
+
+# -------------------------
+# Rewrites (v1 fixed templates)
+# -------------------------
+# The templates are static, so they are scrubbed once here instead of on every
+# TRANSFORM. _sanitize_rewrite stays the gate for any future dynamic rewrite.
+_TIMING_REWRITE = _sanitize_rewrite(
+    "What are the common factors and risks people consider when deciding whether to hold or sell an investment, "
+    "and why is market timing difficult in general?"
+)
+_ALLOCATION_REWRITE = _sanitize_rewrite(
+    "What are general frameworks people use to think about diversification, time horizon, liquidity needs, "
+    "and risk tolerance when building a long-term investment plan (conceptually)?"
+)
+_DEFAULT_REWRITE = _sanitize_rewrite(
+    "What are general frameworks to evaluate investment options based on goals, time horizon, and risk tolerance, "
+    "and what tradeoffs typically matter?"
+)
+
+
+def _safe_rewrite_for_advice(text: str) -> str:
     """
     Convert advice-seeking questions into an educational, non-actionable question.
     Must not mention specific assets/tickers or amounts.
+    Returns one of the pre-sanitized templates above.
+    Expects the already-stripped query from route(); patterns are case-insensitive.
     """
     # Generic, safe reframes. Pick based on detected type.
-    t = original.strip().lower()
+    if _TIMING_RE.search(text):
+        return _TIMING_REWRITE
 
-    if _matches_any(_TIMING_PATTERNS, t):
-        return (
-            "What are the common factors and risks people consider when deciding whether to hold or sell an investment, "
-            "and why is market timing difficult in general?"
-        )
-
-    if _matches_any(_ALLOCATION_PATTERNS, t):
-        return (
-            "What are general frameworks people use to think about diversification, time horizon, liquidity needs, "
-            "and risk tolerance when building a long-term investment plan (conceptually)?"
-        )
+    if _ALLOCATION_RE.search(text):
+        return _ALLOCATION_REWRITE
 
     # Default advice-to-education rewrite
-    return (
-        "What are general frameworks to evaluate investment options based on goals, time horizon, and risk tolerance, "
-        "and what tradeoffs typically matter?"
+    return _DEFAULT_REWRITE
+
+# -------------------------
+# Decisions (v1 fixed outcomes)
+# -------------------------
+# Every possible outcome is known at import, and PolicyDecision is frozen, so
+# route() hands out shared instances instead of constructing one per call.
+_ALLOW_DECISION = PolicyDecision(
+    action=PolicyAction.ALLOW,
+    reason=REASON_GENERAL_EDU,
+    rewrite=None,
+)
+_REFUSE_DECISION = PolicyDecision(
+    action=PolicyAction.REFUSE,
+    reason=REASON_ILLEGAL_FINANCIAL,
+    rewrite=None,
+)
+_TRANSFORM_DECISIONS = {
+    (reason, rewrite): PolicyDecision(
+        action=PolicyAction.TRANSFORM,
+        reason=reason,
+        rewrite=rewrite,
     )
+    for reason in (REASON_ASSET_RECOMMENDATION, REASON_PORTFOLIO_ALLOCATION, REASON_TIMING_REQUEST)
+    for rewrite in (_TIMING_REWRITE, _ALLOCATION_REWRITE, _DEFAULT_REWRITE)
+}
+
+
+def _transform(reason: str, text: str) -> PolicyDecision:
+    return _TRANSFORM_DECISIONS[reason, _safe_rewrite_for_advice(text)]
 
 
 def route(user_text: str) -> PolicyDecision:
@@ -129,70 +201,38 @@ def route(user_text: str) -> PolicyDecision:
     - TRANSFORM: advice-seeking -> rewrite into educational framing
     - REFUSE: illegal/harmful financial wrongdoing
     """
-    text = (user_text or "").strip()
-    if not text:
-        return PolicyDecision(
-            action=PolicyAction.ALLOW,
-            reason=REASON_GENERAL_EDU,
-            rewrite=None,
-        )
+    return _route_cached(user_text or "")
 
-    # 1) REFUSE: illegal/harmful
-    if _matches_any(_ILLEGAL_PATTERNS, text):
-        return PolicyDecision(
-            action=PolicyAction.REFUSE,
-            reason=REASON_ILLEGAL_FINANCIAL,
-            rewrite=None,
-        )
 
-    # 2) TRANSFORM: explicit advice / recommendation / timing / allocation
-    if _matches_any(_ADVICE_PATTERNS, text):
-        rw = _safe_rewrite_for_advice(text)
-        return PolicyDecision(
-            action=PolicyAction.TRANSFORM,
-            reason=REASON_ASSET_RECOMMENDATION,
-            rewrite=_sanitize_rewrite(rw),
-        )
-
-    if _matches_any(_ALLOCATION_PATTERNS, text):
-        rw = _safe_rewrite_for_advice(text)
-        return PolicyDecision(
-            action=PolicyAction.TRANSFORM,
-            reason=REASON_PORTFOLIO_ALLOCATION,
-            rewrite=_sanitize_rewrite(rw),
-        )
-
-    if _matches_any(_TIMING_PATTERNS, text):
-        rw = _safe_rewrite_for_advice(text)
-        return PolicyDecision(
-            action=PolicyAction.TRANSFORM,
-            reason=REASON_TIMING_REQUEST,
-            rewrite=_sanitize_rewrite(rw),
-        )
+def route_many(user_texts: Iterable[str]) -> list[PolicyDecision]:
+    """
+    Route a batch of user requests (eval sets, regression runs).
+    Returns one decision per input, in order, identical to calling route() on each.
+    """
+    route_one = _route_cached  # bind once for the loop
+    return [route_one(t or "") for t in user_texts]
 
-    # 3) Default allow
-    return PolicyDecision(
-        action=PolicyAction.ALLOW,
-        reason=REASON_GENERAL_EDU,
-        rewrite=None,
-    )
 
+@lru_cache(maxsize=4096)
+def _route_cached(user_text: str) -> PolicyDecision:
+    # route() is pure and PolicyDecision is frozen, so repeated prompts are safe to memoize
+    text = user_text.strip()
+    if not text:
+        return _ALLOW_DECISION
 
-def _sanitize_rewrite(rewrite: str) -> str:
-    """
-    Final safety scrub: ensure rewrites are not actionable.
-    - Remove ticker-like tokens (AAPL, TSLA) if any slip in.
-    - Remove dollar amounts.
-    """
-    out = rewrite
+    # 1) REFUSE: illegal/harmful
+    if _ILLEGAL_RE.search(text):
+        return _REFUSE_DECISION
 
-    # Remove $ amounts
-    out = re.sub(r"\$?\d[\d,]*(\.\d+)?", "[amount]", out)
+    # 2) TRANSFORM: explicit advice / recommendation / timing / allocation
+    if _ADVICE_RE.search(text):
+        return _transform(REASON_ASSET_RECOMMENDATION, text)
 
-    # Remove ticker-like tokens (very conservative)
-    out = _TICKER_LIKE.sub("[asset]", out)
+    if _ALLOCATION_RE.search(text):
+        return _transform(REASON_PORTFOLIO_ALLOCATION, text)
 
-    # Avoid buy/sell verbs in rewrites
-    out = re.sub(r"\b(buy|sell)\b", "trade", out, flags=re.IGNORECASE)
+    if _TIMING_RE.search(text):
+        return _transform(REASON_TIMING_REQUEST, text)
 
-    return out.strip()
+    # 3) Default allow
+    return _ALLOW_DECISION
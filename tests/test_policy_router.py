@@ -1,11 +1,5 @@
-import sys
-from pathlib import Path
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
-
 import pytest
-from finmentor.guardrails.policy_router import route, PolicyAction
+from finmentor.guardrails.policy_router import route, route_many, PolicyAction, _route_cached, _sanitize_rewrite
 
 def assert_transform(d):
     assert d.action == PolicyAction.TRANSFORM
@@ -191,3 +185,52 @@ def test_edge_how_do_rich_people_invest():
 
 def test_edge_is_index_fund_good():
     assert_transform(route("Is an index fund a good investment?"))
+
+
+# -------------------------
+# CACHING: repeated prompts reuse the decision
+# -------------------------
+
+def test_repeated_query_hits_route_cache():
+    _route_cached.cache_clear()
+    first = route("Should I buy bitcoin?")
+    hits = _route_cached.cache_info().hits
+    assert route("Should I buy bitcoin?") == first
+    assert _route_cached.cache_info().hits == hits + 1
+    assert_transform(first)
+
+
+def test_surrounding_whitespace_does_not_change_decision():
+    _route_cached.cache_clear()
+    padded = route("  Should I buy bitcoin?  ")
+    plain = route("Should I buy bitcoin?")
+    assert padded == plain
+    assert_transform(plain)
+    # The cache is keyed on the raw text, so each spelling gets its own entry
+    assert _route_cached.cache_info().currsize == 2
+
+
+# -------------------------
+# BATCH: route_many mirrors route
+# -------------------------
+
+def test_route_many_matches_route_in_order():
+    queries = ["What is an ETF?", "Should I buy bitcoin?", "How do I launder money?", "", None]
+    decisions = route_many(queries)
+    assert decisions == [route(q) for q in queries]
+    assert [d.action for d in decisions] == [
+        PolicyAction.ALLOW,
+        PolicyAction.TRANSFORM,
+        PolicyAction.REFUSE,
+        PolicyAction.ALLOW,
+        PolicyAction.ALLOW,
+    ]
+
+
+# -------------------------
+# SCRUB: defensive rewrite sanitizer
+# -------------------------
+
+def test_sanitize_rewrite_scrubs_amounts_tickers_and_actions():
+    out = _sanitize_rewrite("Can we buy AAPL or Sell VOO2025 with $5,000.50?")
+    assert out == "Can we trade [asset] or trade [asset][amount] with [amount]?"